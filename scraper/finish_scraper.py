@@ -202,7 +202,7 @@ class MainScraper:
                 return None
                 
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            return BeautifulSoup(response.content, "lxml")
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
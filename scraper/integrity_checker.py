@@ -4,20 +4,121 @@ Specifically checks if chapters on disk match the live versions.
 """
 
 import os
+import sys
 import json
+import time
+import queue
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional, fall back to a full JSON parse
+    msgspec = None
 
 # Import from the main scraper script
-from main_scraper import MainScraper, decode_url, DEFAULT_DATA_DIR
+from main_scraper import (MainScraper, decode_urls_in_data, images_hash, orjson, read_json, read_json_bytes,
+                          write_json, DEFAULT_DATA_DIR)
+
+
+# Threads used to read local chapter files while pages are being fetched
+IO_WORKERS = 16
+# Minimum seconds between two progress status updates
+STATUS_INTERVAL = 0.25
+
+# Returned instead of an image list when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+# Returned instead of an image list for chapters skipped as recently checked
+RECENTLY_CHECKED = object()
+# Returned instead of an image list when the live page could not be fetched
+FETCH_FAILED = object()
+
+@dataclass
+class ChapterFile:
+    """The fields of a local chapter file that the integrity check needs."""
+    total_images: int = 0
+    images: List[str] = field(default_factory=list)
+    images_prefix: str = ""
+    images_suffixes: Optional[List[str]] = None
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def image_list(self) -> List[str]:
+        """Return the full image URL list, packed or not."""
+        if self.images_suffixes is not None:
+            return [self.images_prefix + suffix for suffix in self.images_suffixes]
+        return self.images
+
+    def image_count(self) -> int:
+        """Return total_images, or the list length for files without it."""
+        return self.total_images or len(self.image_list())
+
+    def image_hash(self) -> str:
+        """Return content_hash, or compute it for files without one."""
+        return self.content_hash or images_hash(self.image_list())
+
+
+# Decodes only the ChapterFile fields and skips every other key
+_chapter_decoder = msgspec.json.Decoder(ChapterFile) if msgspec else None
+_chapter_fields = frozenset(ChapterFile.__dataclass_fields__)
+
+
+def decode_chapter_file(raw: bytes) -> ChapterFile:
+    """Decode raw chapter JSON into a ChapterFile."""
+    if _chapter_decoder is not None:
+        return _chapter_decoder.decode(raw)
+    return chapter_file_from_dict(orjson.loads(raw) if orjson else json.loads(raw))
+
+
+def chapter_file_from_dict(data: Dict[str, Any]) -> ChapterFile:
+    """Build a ChapterFile from already parsed chapter data."""
+    return ChapterFile(**{key: value for key, value in data.items() if key in _chapter_fields})
+
+
+def changed_positions(local_images: List[str], live_images: List[str]) -> List[int]:
+    """Return the 1-indexed positions where two equally long image lists differ."""
+    # C-level list comparison settles the common unchanged case in one call
+    if local_images == live_images:
+        return []
+    return [i + 1 for i, (local_url, live_url) in enumerate(zip(local_images, live_images)) if local_url != live_url]
+
+
+# Checker instance owned by each worker process of check_all
+_worker_checker = None
+
+
+def _init_worker(data_dir: str, delay: float, compress: bool, skip_hours: float, concurrency: int):
+    """Create one IntegrityChecker per worker process."""
+    global _worker_checker
+    _worker_checker = IntegrityChecker(data_dir=data_dir, delay=delay, compress=compress, skip_hours=skip_hours,
+                                       concurrency=concurrency)
+
+
+def _check_comic_worker(slug: str):
+    """Run check_comic inside a worker process."""
+    _worker_checker.check_comic(slug)
 
 
 class IntegrityChecker(MainScraper):
-    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, delay: float = 1.0):
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, delay: float = 1.0, compress: bool = False,
+                 skip_hours: float = 0.0, concurrency: int = 8):
         print("=" * 50)
         print("INTEGRITY CHECKER - Mode: Check Existing Chapters")
         print("=" * 50)
-        super().__init__(data_dir=data_dir, delay=delay, force=True)
+        super().__init__(data_dir=data_dir, delay=delay, force=True, compress=compress, concurrency=concurrency)
+        # Single writer thread so chapter saves never block the check loop
+        self._write_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        self._last_status_ts = 0.0
+        # Chapters verified within this window (and unchanged locally) are skipped
+        self.skip_hours = skip_hours
+        self.skip_window_seconds = skip_hours * 3600
+        self._state = {}
         print("Integrity Checker ready.\n")
 
     def check_comic(self, slug: str):
@@ -31,12 +132,8 @@ class IntegrityChecker(MainScraper):
             print(f"Error: Metadata not found for {slug}")
             return
 
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-            # Decode b64 chapters
-            chapters = metadata.get("chapters", [])
-            for ch in chapters:
-                ch["url"] = decode_url(ch["url"])
+        metadata = self._load_decoded_metadata(slug, metadata_path)
+        chapters = metadata.get("chapters", [])
 
         chapters_dir = os.path.join(self.comics_dir, slug, "chapters")
         if not os.path.exists(chapters_dir):
@@ -45,39 +142,66 @@ class IntegrityChecker(MainScraper):
 
         updated_count = 0
         total_checked = 0
+        skipped_count = 0
+        failed_count = 0
+
+        # Per-comic record of when each chapter was last verified
+        state_path = os.path.join(self.cache_dir, slug, "integrity_state.json")
+        self._state = read_json(state_path) if os.path.exists(state_path) else {}
 
+        # One directory scan instead of an exists() call per chapter
+        with os.scandir(chapters_dir) as entries:
+            existing = {entry.name: entry for entry in entries if entry.is_file()}
+
+        # Read local chapters and fetch live pages concurrently
+        pending = []
         for ch in chapters:
             chapter_num = ch["chapter"]
-            chapter_filename = f"chapter-{chapter_num.replace('.', '-')}.json"
-            chapter_path = os.path.join(chapters_dir, chapter_filename)
+            chapter_filename = self._chapter_filename(chapter_num)
 
-            if not os.path.exists(chapter_path):
+            gz_entry = existing.get(chapter_filename + ".gz")
+            plain_entry = existing.get(chapter_filename)
+            # Prefer the compressed file unless a newer plain one sits next to it
+            if gz_entry and (not plain_entry or gz_entry.stat().st_mtime >= plain_entry.stat().st_mtime):
+                chapter_filename = gz_entry.name
+            elif not plain_entry:
                 print(f"  [?] Chapter {chapter_num} missing locally. Skipping.")
                 continue
+            chapter_path = os.path.join(chapters_dir, chapter_filename)
+            pending.append((ch, chapter_path))
+
+        results = asyncio.run(self._fetch_all(slug, pending))
 
+        checked_at = time.time()
+        # One timestamp for every chapter updated in this check
+        scraped_at = datetime.fromtimestamp(checked_at).isoformat()
+        for (ch, _), (local_data, live_images, validators) in zip(pending, results):
+            chapter_num = ch["chapter"]
+            if live_images is RECENTLY_CHECKED:
+                skipped_count += 1
+                continue
+            if live_images is FETCH_FAILED:
+                failed_count += 1
+                continue
+            # Only chapters compared against the live page count as checked
             total_checked += 1
-            with open(chapter_path, "r", encoding="utf-8") as f:
-                local_data = json.load(f)
-                local_img_count = local_data.get("total_images", 0)
-                if not local_img_count and "images" in local_data:
-                    local_img_count = len(local_data["images"])
-
-            # Fetch live image list
-            print(f"  [*] Checking Chapter {chapter_num} (local: {local_img_count} images)...", end="\r")
-            live_images = self.scrape_chapter_images(ch["url"])
-            live_img_count = len(live_images)
+            if live_images is NOT_MODIFIED:
+                self._state[chapter_num] = {"hash": local_data.image_hash(), "ts": checked_at}
+                continue
 
             # Get local images for URL comparison
-            local_images = local_data.get("images", [])
+            local_images = local_data.image_list()
+            local_img_count = local_data.image_count()
+            live_img_count = len(live_images)
             
             # Check for URL changes (even if count is same)
             urls_changed = False
             changed_urls = []
             if live_img_count == local_img_count and live_img_count > 0:
-                for i, (local_url, live_url) in enumerate(zip(local_images, live_images)):
-                    if local_url != live_url:
-                        urls_changed = True
-                        changed_urls.append(i + 1)  # 1-indexed for display
+                # Matching digests mean identical lists, no need to diff per URL
+                if local_data.content_hash != images_hash(live_images):
+                    changed_urls = changed_positions(local_images, live_images)  # 1-indexed for display
+                    urls_changed = bool(changed_urls)
 
             needs_update = False
             update_reason = ""
@@ -102,24 +226,186 @@ class IntegrityChecker(MainScraper):
                     "title": ch["title"],
                     "url": ch["url"],
                     "date": ch["date"],
-                    "scraped_at": datetime.now().isoformat(),
+                    "scraped_at": scraped_at,
                     "images": live_images,
                     "total_images": live_img_count,
                     "updated_via": "integrity_checker",
                     "update_reason": update_reason
                 }
-                self.save_chapter(slug, chapter_num, updated_data)
+                updated_data.update(validators)
+                self._write_q.put((slug, chapter_num, updated_data))
                 updated_count += 1
+            elif any(getattr(local_data, key) != value for key, value in validators.items()):
+                # Remember new validators so the next run can use a conditional request
+                self._write_q.put((slug, chapter_num, {**read_json(self._find_chapter_file(slug, chapter_num)), **validators}))
+
+            if live_img_count > 0:
+                content_hash = images_hash(live_images) if needs_update else local_data.image_hash()
+                self._state[chapter_num] = {"hash": content_hash, "ts": checked_at}
 
+        # Wait for queued writes before reporting
+        self._write_q.join()
+        self._ensure_cache_dir(slug)
+        write_json(state_path, self._state, indent=False)
         print(f"\nIntegrity check complete for {slug}.")
         print(f"Checked: {total_checked}, Updated: {updated_count}")
+        if skipped_count:
+            print(f"Skipped {skipped_count} chapter(s) verified in the last {self.skip_hours:g} hours.")
+        if failed_count:
+            print(f"Failed to fetch {failed_count} chapter(s); they were not checked.")
+
+    def _status(self, message: str):
+        """Overwrite the status line, at most once every STATUS_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_status_ts < STATUS_INTERVAL:
+            return
+        self._last_status_ts = now
+        sys.stdout.write(message + "\r")
+        sys.stdout.flush()
+
+    def _writer_loop(self):
+        """Save queued (slug, chapter_num, data) items one at a time."""
+        while True:
+            slug, chapter_num, chapter_data = self._write_q.get()
+            try:
+                self.save_chapter(slug, chapter_num, chapter_data)
+            except Exception as e:
+                print(f"Error saving chapter {chapter_num} of {slug}: {e}")
+            finally:
+                self._write_q.task_done()
+
+    def _load_decoded_metadata(self, slug: str, metadata_path: str) -> Dict[str, Any]:
+        """
+        Load metadata with decoded chapter URLs.
+
+        The decoded copy is cached in the cache dir and reused until
+        metadata.json is modified again.
+        """
+        cache_path = os.path.join(self.cache_dir, slug, "metadata.decoded.json")
+        src_mtime = os.stat(metadata_path).st_mtime
+        try:
+            if os.stat(cache_path).st_mtime >= src_mtime:
+                return read_json(cache_path)
+        except OSError:
+            pass
+
+        metadata = decode_urls_in_data(read_json(metadata_path))
+
+        self._ensure_cache_dir(slug)
+        write_json(cache_path, metadata, indent=False)
+        return metadata
+
+    async def scrape_chapter_images_async(self, chapter_url: str, etag: str = None,
+                                          last_modified: str = None) -> Tuple[Any, Dict[str, str]]:
+        """
+        Conditional counterpart of scrape_chapter_images.
 
-    def check_all(self):
-        """Check all comics in the data directory."""
-        comics = [d for d in os.listdir(self.comics_dir) if os.path.isdir(os.path.join(self.comics_dir, d))]
+        Sends If-None-Match/If-Modified-Since when validators are known.
+
+        Returns:
+            Tuple of (image URLs, NOT_MODIFIED or FETCH_FAILED, response validators)
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            # Same pacing, 429 handling and session as the scraper's own requests
+            response = await self._get(chapter_url, headers)
+            if response.status_code == 304:
+                return NOT_MODIFIED, {}
+            tree = self._parse_response(chapter_url, response)
+        except Exception as e:
+            print(f"Error fetching {chapter_url}: {e}")
+            return FETCH_FAILED, {}
+        if not tree:
+            return FETCH_FAILED, {}
+
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["last_modified"] = response.headers["Last-Modified"]
+        return self._parse_chapter_images(tree), validators
+
+    def _read_local(self, slug: str, chapter_num: str, chapter_path: str) -> ChapterFile:
+        """Read a local chapter file, migrating it to gzip when compression is on."""
+        if self.compress and not chapter_path.endswith(".gz"):
+            # Lazily migrate legacy uncompressed chapters; save_chapter writes
+            # the same packed .gz layout as a fresh save and removes the old file
+            data = read_json(chapter_path)
+            self.save_chapter(slug, chapter_num, data)
+            return chapter_file_from_dict(data)
+        return decode_chapter_file(read_json_bytes(chapter_path))
+
+    async def _fetch_all(self, slug: str,
+                         chapters: List[Tuple[Dict[str, Any], str]]) -> List[Tuple[ChapterFile, Any, Dict[str, str]]]:
+        """
+        Read local chapter files and fetch live image lists for all chapters.
+
+        File reads run on a thread pool so disk latency overlaps with the
+        network requests of other chapters; requests are paced like the
+        scraper's (at most `concurrency` per `delay` seconds).
+
+        Returns:
+            List of (local data, live images, NOT_MODIFIED, RECENTLY_CHECKED
+            or FETCH_FAILED, validators)
+        """
+        loop = asyncio.get_running_loop()
+        # The session binds to the event loop on first use and check_comic
+        # runs a new loop per comic, so each run gets its own session
+        self.session = self._new_session(self.impersonate)
+
+        try:
+            with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_pool:
+                async def check(ch: Dict[str, Any], chapter_path: str) -> Tuple[ChapterFile, Any, Dict[str, str]]:
+                    # Validators from the local file are needed for the request itself
+                    local_data = await loop.run_in_executor(io_pool, self._read_local, slug, ch["chapter"], chapter_path)
+                    entry = self._state.get(ch["chapter"])
+                    if (entry and time.time() - entry["ts"] < self.skip_window_seconds
+                            and entry["hash"] == local_data.image_hash()):
+                        return local_data, RECENTLY_CHECKED, {}
+                    live_images, validators = await self.scrape_chapter_images_async(
+                        ch["url"], local_data.etag, local_data.last_modified)
+                    self._status(f"  [*] Checked Chapter {ch['chapter']} (local: {local_data.image_count()} images)...")
+                    return local_data, live_images, validators
+
+                return await asyncio.gather(*(check(ch, chapter_path) for ch, chapter_path in chapters))
+        finally:
+            await self.session.close()
+
+    def check_all(self, workers: int = None):
+        """
+        Check all comics in the data directory, one worker process per comic.
+
+        The request budget (`concurrency` per `delay` seconds) is shared by
+        all workers, so more processes do not mean more load on the host.
+        """
+        with os.scandir(self.comics_dir) as entries:
+            comics = [entry.name for entry in entries if entry.is_dir()]
         print(f"Found {len(comics)} comics to check.")
-        for slug in comics:
-            self.check_comic(slug)
+
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 8)
+        # Every worker needs at least one request slot of the budget
+        workers = min(workers, self.concurrency)
+        if workers <= 1 or len(comics) <= 1:
+            for slug in comics:
+                self.check_comic(slug)
+            return
+
+        # Comics live in separate directories, so workers never write the same file
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.data_dir, self.delay, self.compress, self.skip_hours,
+                                           self.concurrency // workers)) as executor:
+            futures = {executor.submit(_check_comic_worker, slug): slug for slug in comics}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error checking {futures[future]}: {e}")
 
 
 def main():
@@ -129,14 +415,22 @@ def main():
     parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Directory where data is stored")
     parser.add_argument("--delay", type=float, default=1.0, help="Delay between requests")
     parser.add_argument("--all", action="store_true", help="Check all comics in data-dir")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes for --all (default: CPU count, max 8)")
+    parser.add_argument("--compress", action="store_true", help="Store chapter files gzip-compressed, migrating old ones")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Maximum requests per delay, shared by all --workers (default: 8)")
+    parser.add_argument("--skip-hours", type=float, default=0.0,
+                        help="Skip chapters verified within this many hours and unchanged locally "
+                             "(default: 0, check everything)")
 
     args = parser.parse_args()
-    checker = IntegrityChecker(data_dir=args.data_dir, delay=args.delay)
+    checker = IntegrityChecker(data_dir=args.data_dir, delay=args.delay, compress=args.compress, skip_hours=args.skip_hours,
+                               concurrency=args.concurrency)
 
     if args.comic:
         checker.check_comic(args.comic)
     elif args.all:
-        checker.check_all()
+        checker.check_all(workers=args.workers)
     else:
         parser.print_help()
 
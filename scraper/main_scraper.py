@@ -10,18 +10,36 @@ Features:
 
 import os
 import json
-import time
 import re
 import base64
+import gzip
+import hashlib
 import sys
-from curl_cffi import requests
-from bs4 import BeautifulSoup
+import socket
+import sqlite3
+import zlib
+import asyncio
+from curl_cffi import CurlHttpVersion, CurlOpt
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional, Dict, List, Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
 
 SENSITIVE_DOMAINS = [base64.b64decode("a29taWtpbmRv").decode()]
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_DOMAINS)), re.IGNORECASE)
+
+# Keys whose string values are URLs (besides any key ending in "_url")
+_URL_KEYS = frozenset({"url", "cover_url"})
 
 # Daftar "sidik jari" browser yang didukung oleh curl_cffi.
 # Jangan asal menambah versi (misal chrome113) jika library belum mendukungnya.
@@ -33,17 +51,43 @@ IMPERSONATION_ROTATION = [
     "edge99"        # Alternatif Edge
 ]
 
+# Patterns used by MainScraper._slugify and for stripping the "Komik" title prefix
+_SLUG_RE1 = re.compile(r'[^\w\s-]')
+_SLUG_RE2 = re.compile(r'[-\s]+')
+_KOMIK_PREFIX_RE = re.compile(r'^\s*Komik\s+')
+# Numbered pagination links on the comic list, e.g. <a class="page-numbers" href="...">272</a>
+_PAGE_NUMBER_RE = re.compile(r'class="page-numbers"[^>]*>\s*(\d+)\s*<')
+
+# Labels in the ".spe" info section of a comic page, mapped to metadata keys.
+# Text fields take the text after the label, link fields the first link's text.
+_SPE_TEXT_FIELDS = {
+    "Judul Alternatif": "alternative_titles",
+    "Status": "status",
+    "Pengarang": "author",
+    "Ilustrator": "illustrator",
+}
+_SPE_LINK_FIELDS = {
+    "Grafis": "demographic",
+    "Jenis Komik": "type",
+}
+_SPE_LABEL_RE = re.compile(
+    r'^(' + "|".join(map(re.escape, [*_SPE_TEXT_FIELDS, *_SPE_LINK_FIELDS, "Tema"])) + r'):\s*(.*)$',
+    re.DOTALL,
+)
 
+
+# URLs repeat a lot (covers, chapter links across runs), so memoize both directions
+@lru_cache(maxsize=100_000)
 def encode_url(url: str) -> str:
     """Encode URL to base64 if it contains sensitive domain."""
     if not url:
         return url
-    for domain in SENSITIVE_DOMAINS:
-        if domain in url.lower():
-            return "b64:" + base64.b64encode(url.encode()).decode()
+    if _SENSITIVE_RE.search(url):
+        return "b64:" + base64.b64encode(url.encode()).decode()
     return url
 
 
+@lru_cache(maxsize=100_000)
 def decode_url(encoded: str) -> str:
     """Decode base64 URL back to original."""
     if not encoded:
@@ -53,20 +97,121 @@ def decode_url(encoded: str) -> str:
     return encoded
 
 
-def encode_urls_in_data(data: any) -> any:
-    """Recursively encode all URLs in a data structure."""
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if key in ["url", "cover_url"] or key.endswith("_url"):
-                result[key] = encode_url(value) if isinstance(value, str) else value
-            else:
-                result[key] = encode_urls_in_data(value)
-        return result
-    elif isinstance(data, list):
-        return [encode_urls_in_data(item) for item in data]
-    else:
+def images_hash(images: List[str]) -> str:
+    """Return a SHA-256 digest of an ordered list of image URLs."""
+    return hashlib.sha256("\n".join(images).encode()).hexdigest()
+
+
+def pack_images(images: List[str]) -> Dict[str, Any]:
+    """Split image URLs into a shared prefix and per-image suffixes."""
+    prefix = os.path.commonprefix(images)
+    return {
+        "images_prefix": prefix,
+        "images_suffixes": [url[len(prefix):] for url in images]
+    }
+
+
+def unpack_images(chapter_data: Dict[str, Any]) -> List[str]:
+    """Return the full image URL list of a chapter, packed or not."""
+    if "images_suffixes" in chapter_data:
+        prefix = chapter_data.get("images_prefix", "")
+        return [prefix + suffix for suffix in chapter_data["images_suffixes"]]
+    return chapter_data.get("images", [])
+
+
+def encode_urls_in_data(data: Any) -> Any:
+    """
+    Encode all URLs in a data structure.
+
+    Walks the structure with an explicit stack and returns a copy; the input
+    is left untouched because callers keep using the plain URLs after saving.
+    """
+    if not isinstance(data, (dict, list)):
         return data
+    root = {} if isinstance(data, dict) else []
+    stack = [(data, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for key, value in src.items():
+                if key in _URL_KEYS or key.endswith("_url"):
+                    if isinstance(value, str):
+                        value = encode_url(value)
+                elif isinstance(value, (dict, list)):
+                    child = {} if isinstance(value, dict) else []
+                    stack.append((value, child))
+                    value = child
+                dst[key] = value
+        else:
+            for item in src:
+                if isinstance(item, (dict, list)):
+                    child = {} if isinstance(item, dict) else []
+                    stack.append((item, child))
+                    item = child
+                dst.append(item)
+    return root
+
+
+def decode_urls_in_data(data: Any) -> Any:
+    """Decode all encoded URLs in a data structure in place and return it."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str):
+                    if value.startswith("b64:") and (key in _URL_KEYS or key.endswith("_url")):
+                        node[key] = decode_url(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return data
+
+
+def _touch(path: str):
+    """Create an empty file, or bump its mtime if it already exists."""
+    open(path, "ab").close()
+    os.utime(path)
+
+
+def read_json_bytes(path: str) -> bytes:
+    """Return the raw JSON bytes of a file, decompressing it if it ends in .gz."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".gz"):
+        raw = gzip.decompress(raw)
+    return raw
+
+
+def read_json(path: str) -> Any:
+    """Load a JSON file (gzip-compressed if it ends in .gz), using orjson when available."""
+    raw = read_json_bytes(path)
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def write_json(path: str, data: Any, indent: bool = True):
+    """Write data as UTF-8 JSON (gzip-compressed if path ends in .gz).
+
+    The file is written to a temporary path and moved into place, so readers
+    never see a partially written file.
+
+    indent: Pretty-print with 2 spaces, otherwise write compact JSON
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        payload = orjson.dumps(data, option=option)
+    elif indent:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if path.endswith(".gz"):
+        # Fixed mtime keeps the output stable when the data has not changed
+        payload = gzip.compress(payload, compresslevel=6, mtime=0)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
 
 
 # Calculate default data directory relative to script location
@@ -77,40 +222,83 @@ DEFAULT_DATA_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "data"))
 class MainScraper:
     BASE_URL = base64.b64decode("aHR0cHM6Ly9rb21pa2luZG8uY2g=").decode()
     LIST_URL = f"{BASE_URL}/komik-terbaru/"
+    # Translation table used to normalize chapter numbers in filenames
+    _DOT_TO_DASH = str.maketrans({".": "-"})
+    # Retries for HTTP 429, and the wait used when Retry-After is missing (seconds)
+    MAX_RETRIES = 3
+    DEFAULT_RETRY_AFTER = 30.0
     
-    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, delay: float = 1.0, force: bool = False, limit_chapters: int = None):
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, delay: float = 1.0, force: bool = False, limit_chapters: int = None,
+                 compress: bool = False, concurrency: int = 8):
         """
         Initialize the scraper.
+
+        compress: Store chapter files gzip-compressed (chapter-N.json.gz)
+        concurrency: Maximum number of requests in flight at the same time
         """
         print(f"Initializing Scraper (data_dir: {data_dir})")
         self.data_dir = data_dir
         self.delay = delay
         self.force = force
         self.limit_chapters = limit_chapters
+        self.compress = compress
+        self.concurrency = max(1, concurrency)
+        # Earliest event loop time the next request may start (see _throttle)
+        self._next_request_at = 0.0
+        # Event loop time until which no request may start after a 429
+        self._paused_until = 0.0
         print("Configuring browser impersonation...")
         # Use Edge as default since we are on Windows runner
-        self.session = requests.Session(impersonate="edge101")
+        self.impersonate = "edge101"
+        # "host:port:ip" entry pinning BASE_URL's address (see _pin_host)
+        self._host_pin: Optional[str] = None
+        # One async session for the whole run so connections and cookies are reused
+        self.session = self._new_session(self.impersonate)
         print("Scraper initialized successfully.")
         
-        # We rely more on curl_cffi's impersonate than manual headers to avoid inconsistencies
-        self.session.headers.update({
-            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Referer": "https://www.google.com/"
-        })
+        # Directories already created during this run (see _ensure_dir)
+        self._dirs_created = set()
         
         # Create directories
         self.comics_dir = os.path.join(data_dir, "comics")
-        os.makedirs(self.comics_dir, exist_ok=True)
+        self._ensure_dir(self.comics_dir)
+        # Local-only derived data (may contain decoded URLs, never committed)
+        self.cache_dir = os.path.join(data_dir, ".cache")
+        # Conditional-GET cache for list/detail pages, opened on first use (see _http_cache)
+        self._http_cache_db: Optional[sqlite3.Connection] = None
         
         # Load or create index
         self.index_path = os.path.join(data_dir, "index.json")
         self.index = self._load_index()
+        # Index entries keyed by slug; the file keeps storing them as a list
+        self._comics_by_slug = {c["slug"]: c for c in self.index.get("comics", [])}
+        
+        # Resolve the site once instead of on every new connection
+        self._pin_host()
+    
+    def _ensure_dir(self, path: str):
+        """Create a directory once per run, skipping the syscall for known directories."""
+        if path in self._dirs_created:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._dirs_created.add(path)
+
+    def _ensure_cache_dir(self, *parts: str) -> str:
+        """Create a directory inside the cache dir and keep the cache out of git."""
+        path = os.path.join(self.cache_dir, *parts)
+        if path in self._dirs_created:
+            return path
+        self._ensure_dir(path)
+        gitignore_path = os.path.join(self.cache_dir, ".gitignore")
+        if not os.path.exists(gitignore_path):
+            with open(gitignore_path, "w", encoding="utf-8") as f:
+                f.write("*\n")
+        return path
     
     def _load_index(self) -> Dict[str, Any]:
         """Load existing index or create new one."""
         if os.path.exists(self.index_path):
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return read_json(self.index_path)
         return {
             "last_updated": None,
             "total_comics": 0,
@@ -124,8 +312,15 @@ class MainScraper:
             return
             
         self.index["last_updated"] = datetime.now().isoformat()
-        with open(self.index_path, "w", encoding="utf-8") as f:
-            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        write_json(self.index_path, self.index)
+
+    def _merge_into_index(self, comics: List[Dict[str, Any]]):
+        """Add or update index entries and save the index."""
+        for comic in comics:
+            self._comics_by_slug[comic["slug"]] = comic
+        self.index["comics"] = list(self._comics_by_slug.values())
+        self.index["total_comics"] = len(self.index["comics"])
+        self._save_index()
 
     def rebuild_index(self):
         """Rebuild index.json from existing comic metadata files."""
@@ -139,25 +334,87 @@ class MainScraper:
             metadata_path = os.path.join(self.comics_dir, slug, "metadata.json")
             if os.path.exists(metadata_path):
                 try:
-                    with open(metadata_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        all_comics.append({
-                            "slug": slug,
-                            "title": data.get("title", ""),
-                            "type": data.get("type", ""),
-                            "status": data.get("status", ""),
-                            "rating": data.get("rating", 0),
-                            "total_chapters": data.get("total_chapters", 0)
-                        })
+                    data = read_json(metadata_path)
+                    all_comics.append({
+                        "slug": slug,
+                        "title": data.get("title", ""),
+                        "type": data.get("type", ""),
+                        "status": data.get("status", ""),
+                        "rating": data.get("rating", 0),
+                        "total_chapters": data.get("total_chapters", 0)
+                    })
                 except Exception as e:
                     print(f"Error reading metadata for {slug}: {e}")
         
-        self.index["comics"] = all_comics
-        self.index["total_comics"] = len(all_comics)
-        self._save_index()
+        self._comics_by_slug = {}
+        self._merge_into_index(all_comics)
         print(f"Index rebuilt with {len(all_comics)} comics.")
 
-    def warm_up(self):
+    def _new_session(self, impersonate: str) -> AsyncSession:
+        """Create an HTTP session for the given impersonation profile."""
+        session = AsyncSession(
+            impersonate=impersonate,
+            max_clients=self.concurrency,
+            # Multiplex requests over one HTTP/2 connection instead of a handshake per request
+            http_version=CurlHttpVersion.V2TLS,
+        )
+        if self._host_pin:
+            session.curl_options[CurlOpt.RESOLVE] = [self._host_pin]
+        # We rely more on curl_cffi's impersonate than manual headers to avoid inconsistencies
+        session.headers.update({
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Referer": "https://www.google.com/"
+        })
+        return session
+
+    def _pin_host(self):
+        """
+        Resolve the BASE_URL host and pin its addresses on the session
+        (CURLOPT_RESOLVE), so libcurl skips DNS lookups for new connections.
+        
+        All resolved addresses are pinned so libcurl can still fall back to
+        another one (e.g. IPv4 when the IPv6 route is broken).
+        """
+        parsed = urlparse(self.BASE_URL)
+        port = parsed.port or 443
+        try:
+            infos = socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            print(f"Could not resolve {parsed.hostname}: {e}")
+            return
+        addresses = []
+        for info in infos:
+            ip = info[4][0]
+            if ":" in ip:
+                ip = f"[{ip}]"
+            if ip not in addresses:
+                addresses.append(ip)
+        self._host_pin = f"{parsed.hostname}:{port}:{','.join(addresses)}"
+        self.session.curl_options[CurlOpt.RESOLVE] = [self._host_pin]
+
+    async def close(self):
+        """Close the HTTP session and the HTTP cache."""
+        await self.session.close()
+        if self._http_cache_db is not None:
+            self._http_cache_db.close()
+            self._http_cache_db = None
+
+    def _http_cache(self) -> sqlite3.Connection:
+        """Return the HTTP response cache (url -> validators + compressed body)."""
+        if self._http_cache_db is None:
+            path = os.path.join(self._ensure_cache_dir(), "http_cache.sqlite")
+            db = sqlite3.connect(path)
+            # It is only a cache, losing the last writes on a crash is fine
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB)"
+            )
+            self._http_cache_db = db
+        return self._http_cache_db
+
+    async def warm_up(self):
         """
         Perform a warm-up request to the home page to establish session/cookies.
         Includes retries and alternative impersonation if needed.
@@ -165,13 +422,13 @@ class MainScraper:
         for attempt, impersonate_ver in enumerate(IMPERSONATION_ROTATION, 1):
             print(f"Performing warm-up request (Attempt {attempt}, {impersonate_ver})...")
             try:
-                self.session = requests.Session(impersonate=impersonate_ver)
-                self.session.headers.update({
-                    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                    "Referer": "https://www.google.com/"
-                })
+                # Keep the existing session (and its connections) unless the profile changes
+                if impersonate_ver != self.impersonate:
+                    await self.session.close()
+                    self.session = self._new_session(impersonate_ver)
+                    self.impersonate = impersonate_ver
                 
-                response = self.session.get(self.BASE_URL, timeout=30)
+                response = await self.session.get(self.BASE_URL, timeout=30)
                 
                 if response.status_code == 200:
                     print(f"Warm-up successful using {impersonate_ver}.")
@@ -182,56 +439,161 @@ class MainScraper:
                     if "Just a moment" in response.text:
                         print("Cloudflare 'Just a moment' challenge detected.")
                     
-                time.sleep(self.delay * 2)
+                await asyncio.sleep(self.delay * 2)
             except Exception as e:
                 print(f"Warm-up attempt {attempt} ({impersonate_ver}) failed: {e}")
                 
         return False
     
-    def _fetch(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch a URL and return BeautifulSoup object."""
+    async def _throttle(self):
+        """
+        Space out request starts so that at most `concurrency` requests
+        begin per `delay` seconds, regardless of how many tasks are waiting.
+        
+        Tasks that booked their slot before a rate-limit pause started also
+        wait for the pause to end, then book a new slot so they do not all
+        fire at once.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + self.delay / self.concurrency
+            await asyncio.sleep(start - now)
+            remaining = self._paused_until - loop.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    async def _fetch(self, url: str, use_cache: bool = False) -> Optional[LexborHTMLParser]:
+        """Fetch a URL and return the parsed HTML tree."""
+        html = await self._fetch_text(url, use_cache)
+        return LexborHTMLParser(html) if html is not None else None
+
+    async def _fetch_text(self, url: str, use_cache: bool = False) -> Optional[str]:
+        """
+        Fetch a URL and return the response body, or None on failure.
+        
+        use_cache: Revalidate against the HTTP cache with If-None-Match /
+            If-Modified-Since and reuse the cached body on 304 Not Modified
+        """
+        headers = {}
+        cached = None
+        if use_cache:
+            cached = self._http_cache().execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if cached:
+                if cached[0]:
+                    headers["If-None-Match"] = cached[0]
+                if cached[1]:
+                    headers["If-Modified-Since"] = cached[1]
+        
         try:
-            time.sleep(self.delay)
-            response = self.session.get(url, timeout=30)
-            
-            if response.status_code == 403:
-                print(f"Access Denied (403) for {url}. The site may be blocking this server's IP.")
-                # Log a snippet of the response to diagnose Cloudflare/blocking
-                snippet = response.text[:500].replace('\n', ' ')
-                print(f"Response snippet: {snippet}")
-                return None
-                
-            response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            response = await self._get(url, headers)
+            if cached and response.status_code == 304:
+                return zlib.decompress(cached[2]).decode("utf-8")
+            html = self._check_response(url, response)
+            if use_cache and html is not None:
+                self._store_cached(url, response, html)
+            return html
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
+
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """
+        GET a URL on the shared session, paced by _throttle.
+        
+        HTTP 429 responses are retried after their Retry-After delay; the last
+        response is returned as is. Connection errors are raised.
+        """
+        try:
+            for attempt in range(self.MAX_RETRIES + 1):
+                await self._throttle()
+                response = await self.session.get(url, headers=headers or {}, timeout=30)
+                if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                    return response
+                wait = self._retry_after(response)
+                print(f"Rate limited on {url}, pausing requests for {wait:.0f}s")
+                # Hold back every request, including ones already waiting for a slot
+                self._paused_until = max(self._paused_until, asyncio.get_running_loop().time() + wait)
+        except CurlConnectionError:
+            # The pinned address may be stale; resolve again for later requests
+            if self._host_pin:
+                await asyncio.to_thread(self._pin_host)
+            raise
+
+    def _store_cached(self, url: str, response, html: str):
+        """Store a response body in the HTTP cache if it has validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        db = self._http_cache()
+        db.execute(
+            "INSERT OR REPLACE INTO responses (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+            (url, etag, last_modified, zlib.compress(html.encode("utf-8"))),
+        )
+        db.commit()
+
+    def _retry_after(self, response) -> float:
+        """Return the wait in seconds requested by a 429 response's Retry-After header."""
+        value = response.headers.get("Retry-After", "").strip()
+        if value.isdigit():
+            return float(value)
+        if value:
+            try:
+                return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+        return self.DEFAULT_RETRY_AFTER
+
+    def _parse_response(self, url: str, response) -> Optional[LexborHTMLParser]:
+        """Validate a response and return the parsed HTML tree."""
+        html = self._check_response(url, response)
+        return LexborHTMLParser(html) if html is not None else None
+
+    def _check_response(self, url: str, response) -> Optional[str]:
+        """Validate a response and return its body text."""
+        if response.status_code == 403:
+            print(f"Access Denied (403) for {url}. The site may be blocking this server's IP.")
+            # Log a snippet of the response to diagnose Cloudflare/blocking
+            snippet = response.text[:500].replace('\n', ' ')
+            print(f"Response snippet: {snippet}")
+            return None
+            
+        response.raise_for_status()
+        return response.text
     
     def _slugify(self, text: str) -> str:
         """Convert text to slug format."""
-        text = text.lower().strip()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
-        return text
+        return _SLUG_RE2.sub('-', _SLUG_RE1.sub('', text.lower().strip()))
     
-    def get_total_pages(self) -> int:
+    async def get_total_pages(self) -> int:
         """Get total number of pages in the manga list."""
-        soup = self._fetch(self.LIST_URL)
-        if not soup:
+        html = await self._fetch_text(self.LIST_URL, use_cache=True)
+        if html is None:
             return 1
         
-        pagination = soup.select(".pagination a.page-numbers")
+        # Only one number is needed, so try the raw HTML before parsing the whole page
+        page_nums = _PAGE_NUMBER_RE.findall(html)
+        if page_nums:
+            return max(map(int, page_nums))
+        
+        tree = LexborHTMLParser(html)
+        pagination = tree.css(".pagination a.page-numbers")
         if pagination:
             # Find the last page number (before "Berikutnya")
             page_nums = []
             for a in pagination:
-                text = a.get_text().strip()
+                text = a.text().strip()
                 if text.isdigit():
                     page_nums.append(int(text))
             return max(page_nums) if page_nums else 1
         return 1
     
-    def scrape_comic_list(self, page: int = 1) -> List[Dict[str, Any]]:
+    async def scrape_comic_list(self, page: int = 1) -> List[Dict[str, Any]]:
         """
         Scrape comic list from a specific page.
         
@@ -242,44 +604,44 @@ class MainScraper:
             List of comic basic info (title, url, cover, type, rating)
         """
         url = f"{self.LIST_URL}page/{page}/" if page > 1 else self.LIST_URL
-        soup = self._fetch(url)
+        tree = await self._fetch(url, use_cache=True)
         
-        if not soup:
+        if not tree:
             return []
         
         comics = []
-        posts = soup.select(".animepost")
+        posts = tree.css(".animepost")
         
         for post in posts:
             try:
                 # Get link and title
-                link_elem = post.select_one("a[href]")
+                link_elem = post.css_first("a[href]")
                 if not link_elem:
                     continue
                 
-                comic_url = link_elem.get("href", "")
-                title = re.sub(r'^\s*Komik\s+', '', link_elem.get("title", "")).strip()
+                comic_url = link_elem.attributes.get("href") or ""
+                title = _KOMIK_PREFIX_RE.sub('', link_elem.attributes.get("title") or "").strip()
                 
                 # Get cover image
-                img_elem = post.select_one("img")
-                cover_url = img_elem.get("src", "") if img_elem else ""
+                img_elem = post.css_first("img")
+                cover_url = (img_elem.attributes.get("src") or "") if img_elem else ""
                 
                 # Get type (Manga/Manhwa/Manhua)
-                type_elem = post.select_one(".typeflag")
+                type_elem = post.css_first(".typeflag")
                 comic_type = ""
                 if type_elem:
-                    classes = type_elem.get("class", [])
+                    classes = (type_elem.attributes.get("class") or "").split()
                     for cls in classes:
                         if cls in ["Manga", "Manhwa", "Manhua"]:
                             comic_type = cls
                             break
                 
                 # Check if colored
-                is_colored = bool(post.select_one(".warnalabel"))
+                is_colored = bool(post.css_first(".warnalabel"))
                 
                 # Get rating
-                rating_elem = post.select_one(".rating i")
-                rating = float(rating_elem.get_text().strip()) if rating_elem else 0.0
+                rating_elem = post.css_first(".rating i")
+                rating = float(rating_elem.text().strip()) if rating_elem else 0.0
                 
                 # Extract slug from URL
                 slug = comic_url.rstrip("/").split("/")[-1]
@@ -300,7 +662,7 @@ class MainScraper:
         
         return comics
     
-    def scrape_comic_detail(self, comic_url: str) -> Optional[Dict[str, Any]]:
+    async def scrape_comic_detail(self, comic_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape detailed information about a comic.
         
@@ -310,8 +672,8 @@ class MainScraper:
         Returns:
             Dictionary with comic metadata
         """
-        soup = self._fetch(comic_url)
-        if not soup:
+        tree = await self._fetch(comic_url, use_cache=True)
+        if not tree:
             return None
         
         metadata = {
@@ -321,74 +683,66 @@ class MainScraper:
         
         try:
             # Get title from page
-            title_elem = soup.select_one(".entry-title")
+            title_elem = tree.css_first(".entry-title")
             if title_elem:
-                metadata["title"] = re.sub(r'^\s*Komik\s+', '', title_elem.get_text()).strip()
+                metadata["title"] = _KOMIK_PREFIX_RE.sub('', title_elem.text()).strip()
             
             # Parse info section
-            info_section = soup.select_one(".spe")
+            info_section = tree.css_first(".spe")
             if info_section:
-                spans = info_section.select("span")
-                for span in spans:
-                    text = span.get_text().strip()
+                for span in info_section.css("span"):
+                    match = _SPE_LABEL_RE.match(span.text().strip())
+                    if not match:
+                        continue
                     
-                    if "Judul Alternatif:" in text:
-                        metadata["alternative_titles"] = text.replace("Judul Alternatif:", "").strip()
-                    elif "Status:" in text:
-                        metadata["status"] = text.replace("Status:", "").strip()
-                    elif "Pengarang:" in text:
-                        metadata["author"] = text.replace("Pengarang:", "").strip()
-                    elif "Ilustrator:" in text:
-                        metadata["illustrator"] = text.replace("Ilustrator:", "").strip()
-                    elif "Grafis:" in text:
-                        link = span.select_one("a")
-                        metadata["demographic"] = link.get_text().strip() if link else ""
-                    elif "Tema:" in text:
-                        themes = [a.get_text().strip() for a in span.select("a")]
-                        metadata["themes"] = themes
-                    elif "Jenis Komik:" in text:
-                        link = span.select_one("a")
-                        metadata["type"] = link.get_text().strip() if link else ""
+                    label, value = match.groups()
+                    if label in _SPE_TEXT_FIELDS:
+                        metadata[_SPE_TEXT_FIELDS[label]] = value.strip()
+                    elif label == "Tema":
+                        metadata["themes"] = [a.text().strip() for a in span.css("a")]
+                    else:
+                        link = span.css_first("a")
+                        metadata[_SPE_LINK_FIELDS[label]] = link.text().strip() if link else ""
             
             # Get genres
-            genre_section = soup.select_one(".genre-info")
+            genre_section = tree.css_first(".genre-info")
             if genre_section:
-                genres = [a.get_text().strip() for a in genre_section.select("a")]
+                genres = [a.text().strip() for a in genre_section.css("a")]
                 metadata["genres"] = genres
             
             # Get cover
-            thumb = soup.select_one(".thumb img")
+            thumb = tree.css_first(".thumb img")
             if thumb:
-                metadata["cover_url"] = thumb.get("src", "")
+                metadata["cover_url"] = thumb.attributes.get("src") or ""
             
             # Get rating
-            rating_elem = soup.select_one(".ratingmanga i[itemprop='ratingValue']")
+            rating_elem = tree.css_first(".ratingmanga i[itemprop='ratingValue']")
             if rating_elem:
-                metadata["rating"] = float(rating_elem.get_text().strip())
+                metadata["rating"] = float(rating_elem.text().strip())
             
             # Get synopsis
-            synopsis_elem = soup.select_one(".entry-content-single p")
+            synopsis_elem = tree.css_first(".entry-content-single p")
             if synopsis_elem:
-                metadata["synopsis"] = synopsis_elem.get_text().strip()
+                metadata["synopsis"] = synopsis_elem.text().strip()
             
             # Get chapters
             chapters = []
-            chapter_list = soup.select(".eps_lst ul li")
+            chapter_list = tree.css(".eps_lst ul li")
             for li in chapter_list:
-                link = li.select_one(".lchx a")
-                date_elem = li.select_one(".dt a")
+                link = li.css_first(".lchx a")
+                date_elem = li.css_first(".dt a")
                 
                 if link:
                     chapter_num = ""
-                    chapter_tag = link.select_one("chapter")
+                    chapter_tag = link.css_first("chapter")
                     if chapter_tag:
-                        chapter_num = chapter_tag.get_text().strip()
+                        chapter_num = chapter_tag.text().strip()
                     
                     chapters.append({
                         "chapter": chapter_num,
-                        "title": link.get("title", ""),
-                        "url": link.get("href", ""),
-                        "date": date_elem.get_text().strip() if date_elem else ""
+                        "title": link.attributes.get("title") or "",
+                        "url": link.attributes.get("href") or "",
+                        "date": date_elem.text().strip() if date_elem else ""
                     })
             
             metadata["chapters"] = chapters
@@ -399,7 +753,7 @@ class MainScraper:
         
         return metadata
     
-    def scrape_chapter_images(self, chapter_url: str) -> List[str]:
+    async def scrape_chapter_images(self, chapter_url: str) -> List[str]:
         """
         Scrape image URLs from a chapter page.
         
@@ -409,17 +763,23 @@ class MainScraper:
         Returns:
             List of image URLs
         """
-        soup = self._fetch(chapter_url)
-        if not soup:
+        tree = await self._fetch(chapter_url)
+        if not tree:
             return []
         
+        return self._parse_chapter_images(tree)
+    
+    def _parse_chapter_images(self, tree: LexborHTMLParser) -> List[str]:
+        """Extract image URLs from a parsed chapter page."""
         images = []
-        img_container = soup.select_one("#chimg-auh")
+        seen = set()
+        img_container = tree.css_first("#chimg-auh")
         
         if img_container:
-            for img in img_container.select("img"):
-                src = img.get("src", "")
-                if src and src not in images:
+            for img in img_container.css("img"):
+                src = img.attributes.get("src") or ""
+                if src and src not in seen:
+                    seen.add(src)
                     images.append(src)
         
         return images
@@ -428,42 +788,122 @@ class MainScraper:
         """Save comic data to file."""
         slug = comic_data.get("slug") or self._slugify(comic_data.get("title", "unknown"))
         comic_dir = os.path.join(self.comics_dir, slug)
-        os.makedirs(comic_dir, exist_ok=True)
+        self._ensure_dir(comic_dir)
         
         # Encode sensitive URLs before saving
         encoded_data = encode_urls_in_data(comic_data)
         
         # Save metadata
         metadata_path = os.path.join(comic_dir, "metadata.json")
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(encoded_data, f, ensure_ascii=False, indent=2)
+        write_json(metadata_path, encoded_data)
         
         # Create chapters directory
         chapters_dir = os.path.join(comic_dir, "chapters")
-        os.makedirs(chapters_dir, exist_ok=True)
+        self._ensure_dir(chapters_dir)
         
         return comic_dir
     
+    def _chapter_filename(self, chapter_num: str) -> str:
+        """Return the uncompressed chapter filename for a chapter number."""
+        # Normalize chapter number for filename
+        return "chapter-" + chapter_num.translate(self._DOT_TO_DASH) + ".json"
+
+    def _find_chapter_file(self, comic_slug: str, chapter_num: str) -> Optional[str]:
+        """
+        Return the path of the stored chapter file (compressed or not), if any.
+        If both exist (e.g. finish_scraper.py rewrote a compressed chapter as
+        plain JSON), the newer one wins; ties go to the compressed file.
+        """
+        chapter_path = os.path.join(self.comics_dir, comic_slug, "chapters", self._chapter_filename(chapter_num))
+        found = None
+        found_mtime = None
+        for path in (chapter_path + ".gz", chapter_path):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if found is None or mtime > found_mtime:
+                found, found_mtime = path, mtime
+        return found
+
+    def _images_sentinel(self, comic_slug: str, chapter_num: str) -> str:
+        """Return the path of the marker file recording that a chapter has images."""
+        chapter_path = os.path.join(self.comics_dir, comic_slug, "chapters", self._chapter_filename(chapter_num))
+        return chapter_path[:-len(".json")] + ".images.done"
+
+    def _should_scrape_chapter(self, comic_slug: str, chapter_num: str, scrape_images: bool) -> bool:
+        """
+        Decide whether a chapter has to be (re-)scraped.
+
+        Uses the images sentinel so a resumed run only needs a stat per
+        chapter; the chapter JSON is read only when the sentinel is missing
+        or older than the chapter file (e.g. re-saved by another script).
+        """
+        if self.force:
+            return True
+        chapter_path = self._find_chapter_file(comic_slug, chapter_num)
+        if not chapter_path:
+            return True
+        if not scrape_images:
+            return False
+        sentinel = self._images_sentinel(comic_slug, chapter_num)
+        try:
+            if os.stat(sentinel).st_mtime >= os.stat(chapter_path).st_mtime:
+                return False
+        except FileNotFoundError:
+            pass
+        if unpack_images(read_json(chapter_path)):
+            # Saved before sentinels existed (or by another script), backfill it
+            _touch(sentinel)
+            return False
+        return True
+
     def save_chapter(self, comic_slug: str, chapter_num: str, chapter_data: Dict[str, Any]):
         """Save chapter data to file."""
         chapters_dir = os.path.join(self.comics_dir, comic_slug, "chapters")
-        os.makedirs(chapters_dir, exist_ok=True)
+        self._ensure_dir(chapters_dir)
         
-        # Normalize chapter number for filename
-        chapter_filename = f"chapter-{chapter_num.replace('.', '-')}.json"
-        chapter_path = os.path.join(chapters_dir, chapter_filename)
+        plain_path = os.path.join(chapters_dir, self._chapter_filename(chapter_num))
+        chapter_path = plain_path + ".gz" if self.compress else plain_path
+        stale_path = plain_path if self.compress else plain_path + ".gz"
+        
+        if "images" in chapter_data or "images_suffixes" in chapter_data:
+            images = unpack_images(chapter_data)
+            stored = {}
+            for key, value in chapter_data.items():
+                if key in ("images", "images_suffixes"):
+                    # Compressed storage also factors out the shared URL prefix
+                    stored.update(pack_images(images) if self.compress else {"images": images})
+                elif key not in ("images_prefix", "content_hash"):
+                    stored[key] = value
+            # Store a digest of the image list so checks can skip per-URL comparison
+            stored["content_hash"] = images_hash(images)
+            chapter_data = stored
         
         # Encode sensitive URLs before saving
         encoded_data = encode_urls_in_data(chapter_data)
+        # Chapters are machine-read only, compact JSON is smaller and faster
+        write_json(chapter_path, encoded_data, indent=False)
+        
+        # Drop the copy in the other format so only one version exists
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
         
-        with open(chapter_path, "w", encoding="utf-8") as f:
-            json.dump(encoded_data, f, ensure_ascii=False, indent=2)
+        # Keep the images sentinel in sync with the saved data
+        sentinel = self._images_sentinel(comic_slug, chapter_num)
+        if unpack_images(chapter_data):
+            _touch(sentinel)
+        elif os.path.exists(sentinel):
+            os.remove(sentinel)
     
-    def scrape_all(self, start_page: int = 1, end_page: Optional[int] = None, 
-                   scrape_chapters: bool = False, scrape_images: bool = False):
+    async def scrape_all(self, start_page: int = 1, end_page: Optional[int] = None, 
+                         scrape_chapters: bool = False, scrape_images: bool = False):
         """
         Scrape all comics from the website.
         
+        Pages, and the comics on each page, are processed concurrently;
+        `concurrency` and `delay` bound the actual request rate.
+        
         Args:
             start_page: Starting page number
             end_page: Ending page number (None for all pages)
@@ -472,121 +912,118 @@ class MainScraper:
         """
         # Get total pages if not specified
         if end_page is None:
-            end_page = self.get_total_pages()
+            end_page = await self.get_total_pages()
             print(f"Total pages found: {end_page}")
         
         # Perform session warm-up
-        self.warm_up()
+        await self.warm_up()
         
-        all_comics = []
+        # Limit how many pages are in progress so results arrive page by page
+        page_slots = asyncio.Semaphore(self.concurrency)
         
-        for page in range(start_page, end_page + 1):
-            print(f"\n--- Scraping page {page}/{end_page} ---")
+        async def scrape_page(page: int) -> int:
+            async with page_slots:
+                print(f"\n--- Scraping page {page}/{end_page} ---")
+                comics = await self.scrape_comic_list(page)
+                print(f"Found {len(comics)} comics on page {page}")
+                summaries = await asyncio.gather(*(
+                    self._scrape_comic(comic, i, len(comics), scrape_chapters, scrape_images)
+                    for i, comic in enumerate(comics, 1)
+                ))
+                # Save progress after every page so an interrupted run keeps it
+                self._merge_into_index(summaries)
+                return len(summaries)
+        
+        scraped = sum(await asyncio.gather(*(scrape_page(page) for page in range(start_page, end_page + 1))))
+        
+        print(f"\n=== Scraping complete! ===")
+        print(f"Scraped/Updated {scraped} comics.")
+        print(f"Total comics in index: {self.index['total_comics']}")
+        print(f"Data saved to: {self.data_dir}")
+
+    async def scrape_chapters(self, comic_slug: str, chapters: List[Dict[str, Any]], scrape_images: bool):
+        """
+        Scrape and save chapters of a comic concurrently.
+        
+        Chapters already on disk are skipped unless forced or missing images.
+        The request rate is still bounded by `concurrency` and `delay`.
+        """
+        # One timestamp for the whole batch instead of one per chapter
+        scraped_at = datetime.now().isoformat()
+        
+        async def scrape_chapter(ch: Dict[str, Any]):
+            # Only scrape if forced OR doesn't exist OR need images but they are missing
+            if not self._should_scrape_chapter(comic_slug, ch["chapter"], scrape_images):
+                print(f"    - Skipping chapter {ch['chapter']} (already exists)")
+                return
             
-            comics = self.scrape_comic_list(page)
-            print(f"Found {len(comics)} comics on page {page}")
+            chapter_data = {
+                "chapter": ch["chapter"],
+                "title": ch["title"],
+                "url": ch["url"],
+                "date": ch["date"],
+                "scraped_at": scraped_at
+            }
             
-            for i, comic in enumerate(comics, 1):
-                # Use existing metadata if it exists and not in force mode
-                slug = comic["slug"]
-                metadata_path = os.path.join(self.comics_dir, slug, "metadata.json")
-                detail = None
-                
-                # Always scrape detail to check for updates
-                print(f"  [{i}/{len(comics)}] Processing: {comic['title']}")
-                detail = self.scrape_comic_detail(comic["url"])
-                if detail:
-                    # Merge basic info with detail
-                    comic.update(detail)
-                    # Save comic (updates scraped_at)
-                    self.save_comic(comic)
-                
-                # Scrape chapters if requested
-                if scrape_chapters and detail and "chapters" in detail:
-                    # Smart Limit: Filter chapters first
-                    chapters_all = detail["chapters"]
-                    chapters_to_scrape = []
-                    
-                    if self.limit_chapters:
-                        count = 0
-                        for ch in chapters_all:
-                            # Check if chapter already exists
-                            chapter_num = ch["chapter"]
-                            chapter_filename = f"chapter-{chapter_num.replace('.', '-')}.json"
-                            chapter_path = os.path.join(self.comics_dir, slug, "chapters", chapter_filename)
-                            
-                            is_missing = not os.path.exists(chapter_path)
-                            
-                            if self.force or is_missing:
-                                chapters_to_scrape.append(ch)
-                                count += 1
-                                
-                            if count >= self.limit_chapters:
-                                break
-                        
-                        if count > 0:
-                            print(f"    - Smart Limit: Queueing {count} chapters (prioritizing missing/newest)...")
-                    else:
-                        chapters_to_scrape = chapters_all
+            if scrape_images:
+                print(f"    - Scraping images for chapter {ch['chapter']}")
+                images = await self.scrape_chapter_images(ch["url"])
+                chapter_data["images"] = images
+                chapter_data["total_images"] = len(images)
+            
+            self.save_chapter(comic_slug, ch["chapter"], chapter_data)
+        
+        await asyncio.gather(*(scrape_chapter(ch) for ch in chapters))
 
-                    for ch in chapters_to_scrape:
-                        chapter_num = ch["chapter"]
-                        chapter_filename = f"chapter-{chapter_num.replace('.', '-')}.json"
-                        chapter_path = os.path.join(self.comics_dir, slug, "chapters", chapter_filename)
-                        
-                        existing_chapter = None
-                        if os.path.exists(chapter_path):
-                            with open(chapter_path, "r", encoding="utf-8") as f:
-                                existing_chapter = json.load(f)
+    async def _scrape_comic(self, comic: Dict[str, Any], i: int, total: int,
+                            scrape_chapters: bool, scrape_images: bool) -> Dict[str, Any]:
+        """Scrape one comic from the list (and its chapters) and return its index entry."""
+        slug = comic["slug"]
+        detail = None
+        
+        # Always scrape detail to check for updates
+        print(f"  [{i}/{total}] Processing: {comic['title']}")
+        detail = await self.scrape_comic_detail(comic["url"])
+        if detail:
+            # Merge basic info with detail
+            comic.update(detail)
+            # Save comic (updates scraped_at)
+            self.save_comic(comic)
+        
+        # Scrape chapters if requested
+        if scrape_chapters and detail and "chapters" in detail:
+            # Smart Limit: Filter chapters first
+            chapters_all = detail["chapters"]
+            chapters_to_scrape = []
+            
+            if self.limit_chapters:
+                count = 0
+                for ch in chapters_all:
+                    # Check if chapter already exists
+                    is_missing = self._find_chapter_file(slug, ch["chapter"]) is None
+                    
+                    if self.force or is_missing:
+                        chapters_to_scrape.append(ch)
+                        count += 1
                         
-                        # Only scrape if forced OR doesn't exist OR need images but they are missing
-                        if self.force or not existing_chapter or (scrape_images and "images" not in existing_chapter):
-                            chapter_data = {
-                                "chapter": ch["chapter"],
-                                "title": ch["title"],
-                                "url": ch["url"],
-                                "date": ch["date"],
-                                "scraped_at": datetime.now().isoformat()
-                            }
-                            
-                            if scrape_images:
-                                print(f"    - Scraping images for chapter {ch['chapter']}")
-                                images = self.scrape_chapter_images(ch["url"])
-                                chapter_data["images"] = images
-                                chapter_data["total_images"] = len(images)
-                            
-                            self.save_chapter(slug, ch["chapter"], chapter_data)
-                        else:
-                            print(f"    - Skipping chapter {ch['chapter']} (already exists)")
+                    if count >= self.limit_chapters:
+                        break
                 
-                all_comics.append({
-                    "slug": slug,
-                    "title": comic.get("title", ""),
-                    "type": comic.get("type", ""),
-                    "status": comic.get("status", ""),
-                    "rating": comic.get("rating", 0),
-                    "total_chapters": comic.get("total_chapters", 0)
-                })
-        
-        # Merge new comics into index
-        existing_slugs = {c["slug"] for c in self.index.get("comics", [])}
-        for comic in all_comics:
-            if comic["slug"] not in existing_slugs:
-                self.index["comics"].append(comic)
+                if count > 0:
+                    print(f"    - Smart Limit: Queueing {count} chapters (prioritizing missing/newest)...")
             else:
-                # Update existing entry
-                for i, existing in enumerate(self.index["comics"]):
-                    if existing["slug"] == comic["slug"]:
-                        self.index["comics"][i] = comic
-                        break
-        
-        self.index["total_comics"] = len(self.index["comics"])
-        self._save_index()
+                chapters_to_scrape = chapters_all
+
+            await self.scrape_chapters(slug, chapters_to_scrape, scrape_images)
         
-        print(f"\n=== Scraping complete! ===")
-        print(f"Scraped/Updated {len(all_comics)} comics.")
-        print(f"Total comics in index: {self.index['total_comics']}")
-        print(f"Data saved to: {self.data_dir}")
+        return {
+            "slug": slug,
+            "title": comic.get("title", ""),
+            "type": comic.get("type", ""),
+            "status": comic.get("status", ""),
+            "rating": comic.get("rating", 0),
+            "total_chapters": comic.get("total_chapters", 0)
+        }
 
 
 def main():
@@ -607,92 +1044,67 @@ def main():
     parser.add_argument("--force", action="store_true", help="Force re-scrape even if data exists")
     parser.add_argument("--rebuild-index", action="store_true", help="Rebuild index.json from existing data")
     parser.add_argument("--limit-chapters", type=int, default=None, help="Limit number of chapters to scrape per comic")
+    parser.add_argument("--compress", action="store_true", help="Store chapter files gzip-compressed (.json.gz)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum number of concurrent requests")
     
     args = parser.parse_args()
     
-    scraper = MainScraper(data_dir=args.data_dir, delay=args.delay, force=args.force, limit_chapters=args.limit_chapters)
+    scraper = MainScraper(data_dir=args.data_dir, delay=args.delay, force=args.force, limit_chapters=args.limit_chapters,
+                          compress=args.compress, concurrency=args.concurrency)
     
     if args.rebuild_index:
         scraper.rebuild_index()
         return
 
-    if args.comic:
-        # Perform session warm-up
-        scraper.warm_up()
+    asyncio.run(run(scraper, args))
+
+
+async def run(scraper: MainScraper, args):
+    """Run the scrape selected by the command line arguments."""
+    try:
+        if args.comic:
+            # Perform session warm-up
+            await scraper.warm_up()
         
-        # Scrape single comic
-        if not args.comic.startswith("http"):
-            comic_url = f"{MainScraper.BASE_URL}/komik/{args.comic}/"
-        else:
-            comic_url = args.comic
+            # Scrape single comic
+            if not args.comic.startswith("http"):
+                comic_url = f"{MainScraper.BASE_URL}/komik/{args.comic}/"
+            else:
+                comic_url = args.comic
         
-        # Extract slug from URL
-        slug = comic_url.rstrip("/").split("/")[-1]
-        metadata_path = os.path.join(scraper.comics_dir, slug, "metadata.json")
+            # Extract slug from URL
+            slug = comic_url.rstrip("/").split("/")[-1]
+            metadata_path = os.path.join(scraper.comics_dir, slug, "metadata.json")
         
-        detail = None
-        if not args.force and os.path.exists(metadata_path):
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                saved_data = json.load(f)
-                detail = {k: decode_url(v) if isinstance(v, str) and k in ["url", "cover_url"] else v 
-                         for k, v in saved_data.items()}
-                # Deep decode for chapters
-                if "chapters" in detail:
-                    for ch in detail["chapters"]:
-                        if "url" in ch:
-                            ch["url"] = decode_url(ch["url"])
-            print(f"Using existing metadata for: {slug}")
-        else:
-            print(f"Scraping single comic: {comic_url}")
-            detail = scraper.scrape_comic_detail(comic_url)
-            if detail:
-                detail["slug"] = slug
-                scraper.save_comic(detail)
+            detail = None
+            if not args.force and os.path.exists(metadata_path):
+                detail = decode_urls_in_data(read_json(metadata_path))
+                print(f"Using existing metadata for: {slug}")
+            else:
+                print(f"Scraping single comic: {comic_url}")
+                detail = await scraper.scrape_comic_detail(comic_url)
+                if detail:
+                    detail["slug"] = slug
+                    scraper.save_comic(detail)
         
-        if detail:
-            if args.chapters or args.images:
-                for ch in detail.get("chapters", []):
-                    # Get original URL (before it was encoded)
-                    chapter_url = ch["url"]
-                    chapter_num = ch["chapter"]
-                    chapter_filename = f"chapter-{chapter_num.replace('.', '-')}.json"
-                    chapter_path = os.path.join(scraper.comics_dir, slug, "chapters", chapter_filename)
-                    
-                    existing_chapter = None
-                    if os.path.exists(chapter_path):
-                        with open(chapter_path, "r", encoding="utf-8") as f:
-                            existing_chapter = json.load(f)
-                    
-                    if args.force or not existing_chapter or (args.images and "images" not in existing_chapter):
-                        chapter_data = {
-                            "chapter": ch["chapter"],
-                            "title": ch["title"],
-                            "url": chapter_url,
-                            "date": ch["date"],
-                            "scraped_at": datetime.now().isoformat()
-                        }
-                        
-                        if args.images:
-                            print(f"  Scraping images for chapter {ch['chapter']}")
-                            images = scraper.scrape_chapter_images(chapter_url)
-                            chapter_data["images"] = images
-                            chapter_data["total_images"] = len(images)
-                        
-                        scraper.save_chapter(slug, ch["chapter"], chapter_data)
-                    else:
-                        print(f"  Skipping chapter {ch['chapter']} (already exists)")
+            if detail:
+                if args.chapters or args.images:
+                    await scraper.scrape_chapters(slug, detail.get("chapters", []), args.images)
             
-            print(f"Comic saved to: {scraper.comics_dir}/{slug}/")
+                print(f"Comic saved to: {scraper.comics_dir}/{slug}/")
+            else:
+                print("Failed to scrape comic")
         else:
-            print("Failed to scrape comic")
-    else:
-        # Scrape all comics
-        scraper.scrape_all(
-            start_page=args.start_page,
-            end_page=args.end_page,
-            scrape_chapters=args.chapters,
-            scrape_images=args.images
-        )
+            # Scrape all comics
+            await scraper.scrape_all(
+                start_page=args.start_page,
+                end_page=args.end_page,
+                scrape_chapters=args.chapters,
+                scrape_images=args.images
+            )
+
+    finally:
+        await scraper.close()
 
 
 if __name__ == "__main__":